@@ -5,6 +5,9 @@ import os
 import uuid
 from datetime import datetime
 import shutil
+import bisect
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 #For image handling
 try:
@@ -23,6 +26,47 @@ except ImportError:
 
 DATA_FILE = "lost_found.json"
 IMG_FOLDER = "img"
+PAGE_SIZE = 20
+WATCH_INTERVAL_MS = 1000
+IMAGE_SCAN_CACHE = "image_scan_cache.json"
+IMAGE_SCAN_CACHE_VERSION = 2  # bump when the decode check changes so old results are redone
+QUARANTINE_FOLDER = os.path.join(IMG_FOLDER, "quarantine")
+SCAN_WORKERS = 8
+SCAN_CHUNK_SIZE = 512
+ORPHAN_GRACE_SECONDS = 3600  # leave files an open Add Item dialog may still save
+
+# Sort options for the item list: label -> (indexed field, largest first)
+SORT_OPTIONS = {
+    "Newest": ("created_at", True),
+    "Oldest": ("created_at", False),
+    "Name": ("name", False),
+    "Status": ("status", False),
+    "Recently Updated": ("updated_at", True),
+}
+INDEXED_FIELDS = ("created_at", "updated_at", "name", "status")
+
+# Sorted indexes kept in step with data: field -> sorted list of (key, id)
+items_by_id = {}
+sort_indexes = {field: [] for field in INDEXED_FIELDS}
+index_keys = {}
+
+# Dashboard counters, updated item by item instead of recounted
+item_counts = {'total': 0, 'open': 0, 'claimed': 0, 'lost': 0, 'found': 0, 'with_images': 0}
+counted_as = {}
+
+# Change feed: callbacks receive a batch (list) of (kind, item_id) pairs with
+# kind "added", "updated" or "deleted"
+change_listeners = []
+
+# Last image scan verdict per item: item_id -> (image_path, decodes)
+image_scan_results = {}
+
+# (mtime, size) of DATA_FILE as last read or written by this instance
+last_file_state = None
+
+# All items (filled by open_data) and the Tk main window (only when run as the app)
+data = []
+root = None
 
 # Ensure img folder exists
 def ensure_img_folder():
@@ -38,8 +82,304 @@ def load_data():
 
 # Save data
 def save_data(data):
+    global last_file_state
     with open(DATA_FILE, "w") as f:
         json.dump(data, f, indent=4)
+    last_file_state = data_file_state()
+
+# Current (mtime, size) of DATA_FILE, or None if it doesn't exist
+def data_file_state():
+    try:
+        st = os.stat(DATA_FILE)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+# Change feed subscription
+def subscribe_changes(callback):
+    change_listeners.append(callback)
+
+def unsubscribe_changes(callback):
+    if callback in change_listeners:
+        change_listeners.remove(callback)
+
+def emit_changes(changes):
+    if not changes:
+        return
+    for callback in list(change_listeners):
+        callback(changes)
+
+def emit_change(kind, item_id):
+    emit_changes([(kind, item_id)])
+
+# Dashboard counters an item contributes to
+def item_counters(item):
+    counters = ['total']
+    if item.get('status') == 'Open':
+        counters.append('open')
+    elif item.get('status') == 'Claimed':
+        counters.append('claimed')
+    if item.get('type') == 'Lost':
+        counters.append('lost')
+    elif item.get('type') == 'Found':
+        counters.append('found')
+    # Trust the last image scan for this path; otherwise just check it exists
+    scanned = image_scan_results.get(item["id"])
+    if scanned and scanned[0] == item.get('image_path'):
+        has_image = scanned[1]
+    else:
+        image_path = resolve_image_path(item.get('image_path'))
+        has_image = bool(image_path) and os.path.exists(image_path)
+    if has_image:
+        counters.append('with_images')
+    return counters
+
+def count_item(item):
+    counters = item_counters(item)
+    counted_as[item["id"]] = counters
+    for name in counters:
+        item_counts[name] += 1
+
+def uncount_item(item_id):
+    for name in counted_as.pop(item_id, ()):
+        item_counts[name] -= 1
+
+# Index key for one field (names sort case-insensitively)
+def index_key(item, field):
+    value = item.get(field) or ""
+    if field == "name":
+        return value.lower()
+    return value
+
+# Add one item to the sorted indexes
+def index_item(item):
+    item_id = item["id"]
+    keys = {field: index_key(item, field) for field in INDEXED_FIELDS}
+    items_by_id[item_id] = item
+    index_keys[item_id] = keys
+    for field in INDEXED_FIELDS:
+        bisect.insort(sort_indexes[field], (keys[field], item_id))
+    count_item(item)
+
+# Remove one item from the sorted indexes using the keys it was indexed with
+def unindex_item(item_id):
+    keys = index_keys.pop(item_id, None)
+    items_by_id.pop(item_id, None)
+    uncount_item(item_id)
+    if keys is None:
+        return
+    for field in INDEXED_FIELDS:
+        index = sort_indexes[field]
+        pos = bisect.bisect_left(index, (keys[field], item_id))
+        if pos < len(index) and index[pos] == (keys[field], item_id):
+            del index[pos]
+
+# Load DATA_FILE into data and index it; headless callers use this before
+# query_items
+def open_data():
+    global last_file_state
+    last_file_state = data_file_state()
+    data[:] = load_data()
+    build_indexes()
+    return data
+
+# Rebuild all indexes from data
+def build_indexes():
+    items_by_id.clear()
+    index_keys.clear()
+    counted_as.clear()
+    item_counts.update(dict.fromkeys(item_counts, 0))
+    for item in data:
+        item.setdefault("id", str(uuid.uuid4()))
+        items_by_id[item["id"]] = item
+        index_keys[item["id"]] = {field: index_key(item, field) for field in INDEXED_FIELDS}
+        count_item(item)
+    for field in INDEXED_FIELDS:
+        sort_indexes[field] = sorted((keys[field], item_id) for item_id, keys in index_keys.items())
+
+# Add, change and remove items (keeps data, indexes and the file in step
+# and tells every change listener). Writes by other instances are merged
+# first so saving doesn't overwrite them; modify_item and remove_item return
+# None if the item was deleted elsewhere.
+def insert_item(item):
+    sync_data_file()
+    data.append(item)
+    index_item(item)
+    save_data(data)
+    emit_change("added", item["id"])
+
+def modify_item(item_id, **changes):
+    sync_data_file()
+    item = items_by_id.get(item_id)
+    if item is None:
+        return None
+    unindex_item(item_id)
+    item.update(changes)
+    index_item(item)
+    save_data(data)
+    emit_change("updated", item_id)
+    return item
+
+def remove_item(item_id):
+    sync_data_file()
+    item = items_by_id.get(item_id)
+    if item is None:
+        return None
+    unindex_item(item_id)
+    for i, existing in enumerate(data):
+        if existing is item:
+            del data[i]
+            break
+    save_data(data)
+    emit_change("deleted", item_id)
+    return item
+
+# Merge records written by another instance: only added, changed or
+# removed records touch the indexes and the change feed
+def apply_external_changes(new_data):
+    if any("id" not in item for item in new_data):
+        # Records without ids can't be matched up; rebuild like at startup
+        old_ids = list(items_by_id)
+        data[:] = new_data
+        build_indexes()
+        emit_changes([("deleted", item_id) for item_id in old_ids] +
+                     [("added", item_id) for item_id in items_by_id])
+        return
+    new_by_id = {item["id"]: item for item in new_data}
+    deleted = [item_id for item_id in items_by_id if item_id not in new_by_id]
+    if deleted:
+        for item_id in deleted:
+            unindex_item(item_id)
+        data[:] = [item for item in data if item["id"] in items_by_id]
+    changes = [("deleted", item_id) for item_id in deleted]
+    for item_id, new_item in new_by_id.items():
+        item = items_by_id.get(item_id)
+        if item is None:
+            data.append(new_item)
+            index_item(new_item)
+            changes.append(("added", item_id))
+        elif item != new_item:
+            unindex_item(item_id)
+            item.clear()
+            item.update(new_item)
+            index_item(item)
+            changes.append(("updated", item_id))
+    emit_changes(changes)
+
+# Poll DATA_FILE for writes by other instances
+def watch_data_file():
+    try:
+        sync_data_file()
+    finally:
+        root.after(WATCH_INTERVAL_MS, watch_data_file)
+
+# Merge DATA_FILE if another instance wrote it since we last read or wrote it
+def sync_data_file():
+    global last_file_state
+    state = data_file_state()
+    if state is None or state == last_file_state:
+        return
+    try:
+        new_data = load_data()
+    except (OSError, ValueError):
+        return  # mid-write, locked or replaced; try again next time
+    last_file_state = state
+    apply_external_changes(new_data)
+
+# Parse a YYYY-MM-DD date filter into the same format as the stored
+# timestamps; empty means no limit
+def parse_date_filter(text):
+    text = text.strip()
+    if not text:
+        return None
+    return datetime.strptime(text, "%Y-%m-%d").date().isoformat()  # raises ValueError on bad input
+
+# Slice [start, end) of a sorted index whose keys fall in the date range
+def date_range_bounds(index, date_from, date_to):
+    start = bisect.bisect_left(index, (date_from,)) if date_from else 0
+    # "\uffff" makes the upper bound inclusive of the whole day/prefix
+    end = bisect.bisect_right(index, (date_to + "\uffff",)) if date_to else len(index)
+    return start, max(start, end)
+
+def item_matches(item, status, item_type, search):
+    if status != "All" and item['status'] != status:
+        return False
+    if item_type != "All" and item.get('type') != item_type:
+        return False
+    if search and not (search in item['name'].lower() or
+                       search in item.get('description', '').lower() or
+                       search in item['poster'].lower()):
+        return False
+    return True
+
+# Fetch one page of items. The cursor is the sort-index entry of the last
+# item on the previous page, so pages stay stable while items are added or
+# removed. total is None when it could only be known with a full scan.
+def query_items(status="All", item_type="All", search="", sort="Newest",
+                created_from=None, created_to=None, updated_from=None, updated_to=None,
+                page_size=PAGE_SIZE, cursor=None):
+    field, descending = SORT_OPTIONS[sort]
+    search = search.lower()
+    ranges = {}
+    if created_from or created_to:
+        ranges["created_at"] = (created_from, created_to)
+    if updated_from or updated_to:
+        ranges["updated_at"] = (updated_from, updated_to)
+    bounds = {f: date_range_bounds(sort_indexes[f], lo, hi) for f, (lo, hi) in ranges.items()}
+
+    entries = sort_indexes[field]
+    start, end = 0, len(entries)
+    if field in bounds:
+        start, end = bounds[field]
+    elif bounds:
+        # Sorting by a different field: if a date range is narrow, sort just
+        # that slice instead of walking the whole sort index
+        range_field = min(bounds, key=lambda f: bounds[f][1] - bounds[f][0])
+        lo, hi = bounds[range_field]
+        if hi - lo <= len(entries) // 8:
+            entries = sorted((index_keys[item_id][field], item_id)
+                             for _, item_id in sort_indexes[range_field][lo:hi])
+            start, end = 0, len(entries)
+
+    total = None
+    if status == "All" and item_type == "All" and not search:
+        if not bounds:
+            total = end - start
+        elif len(bounds) == 1:
+            lo, hi = next(iter(bounds.values()))
+            total = hi - lo
+
+    if cursor is not None:
+        cursor = tuple(cursor)
+        if descending:
+            end = min(end, bisect.bisect_left(entries, cursor))
+        else:
+            start = max(start, bisect.bisect_right(entries, cursor))
+
+    positions = range(end - 1, start - 1, -1) if descending else range(start, end)
+    page = []
+    last_entry = None
+    has_more = False
+    for pos in positions:
+        item_id = entries[pos][1]
+        keys = index_keys[item_id]
+        if any((lo and keys[f] < lo) or (hi and keys[f][:len(hi)] > hi)
+               for f, (lo, hi) in ranges.items()):
+            continue
+        item = items_by_id[item_id]
+        if not item_matches(item, status, item_type, search):
+            continue
+        if len(page) == page_size:
+            has_more = True
+            break
+        page.append(item)
+        last_entry = entries[pos]
+
+    return {
+        'items': page,
+        'next_cursor': last_entry if has_more else None,
+        'total': total
+    }
 
 # Capture image from camera
 def capture_image():
@@ -98,6 +438,205 @@ def upload_image():
             return None
     return None
 
+# Image paths saved on Windows use backslashes; make them usable here
+def resolve_image_path(image_path):
+    if not image_path:
+        return None
+    return os.path.normpath(image_path.replace("\\", "/"))
+
+# Which check image_decodes uses; cached results from another one are redone
+def image_decoder():
+    if PIL_AVAILABLE:
+        return "pil"
+    if CV2_AVAILABLE:
+        return "cv2"
+    return "signature"
+
+# Check that an image file actually decodes
+def image_decodes(path):
+    try:
+        if PIL_AVAILABLE:
+            # verify() doesn't decode JPEG data, so a truncated upload would
+            # pass; load() decodes every pixel like the thumbnails do
+            with Image.open(path) as img:
+                img.load()
+            return True
+        if CV2_AVAILABLE:
+            return cv2.imread(path) is not None
+        # No decoder installed: at least check the file signature
+        with open(path, "rb") as f:
+            header = f.read(8)
+        return header.startswith((b"\xff\xd8\xff", b"\x89PNG", b"GIF8", b"BM"))
+    except Exception:
+        return False
+
+# Stat (and, if referenced and changed since the last scan, decode) a chunk
+# of directory entries; runs on a worker thread
+def check_image_chunk(entries, referenced, cache):
+    results = []
+    for entry in entries:
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        ok = None
+        if entry.name in referenced:
+            cached = cache.get(entry.name)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                ok = cached[2]
+            else:
+                ok = image_decodes(entry.path)
+        # copy2 keeps the source mtime, so ctime tells when the file landed here
+        results.append((entry.name, st.st_mtime_ns, st.st_size, ok, max(st.st_mtime_ns, st.st_ctime_ns)))
+    return results
+
+# Scan img/ for broken image references and unreferenced files (report only;
+# see clean_up_images)
+def scan_images():
+    report = {'scanned': 0, 'broken': [], 'legacy': [], 'orphans': [], 'removed': 0, 'errors': []}
+    ensure_img_folder()
+    img_dir = os.path.normcase(os.path.abspath(IMG_FOLDER))
+
+    # Referenced images, by file name for those stored directly in img/
+    referenced = {}
+    elsewhere = []
+    for item in data:
+        raw_path = item.get('image_path')
+        image_path = resolve_image_path(raw_path)
+        if not image_path:
+            continue
+        if os.sep == "/" and "\\" in raw_path:
+            report['legacy'].append((item['id'], raw_path, image_path))
+        if os.path.normcase(os.path.abspath(os.path.dirname(image_path))) == img_dir:
+            referenced.setdefault(os.path.basename(image_path), []).append(item)
+        else:
+            elsewhere.append((item, image_path))
+
+    try:
+        with open(IMAGE_SCAN_CACHE, "r") as f:
+            cache_file = json.load(f)
+        if (cache_file.get('version') == IMAGE_SCAN_CACHE_VERSION and
+                cache_file.get('decoder') == image_decoder()):
+            cache = cache_file['files']
+        else:
+            cache = {}
+    except (OSError, ValueError, AttributeError, KeyError):
+        cache = {}
+
+    # Listing is sequential; stat and decode run in parallel per chunk
+    new_cache = {}
+    found = {}
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        futures = []
+        chunk = []
+        with os.scandir(IMG_FOLDER) as it:
+            for entry in it:
+                if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                    continue
+                chunk.append(entry)
+                if len(chunk) == SCAN_CHUNK_SIZE:
+                    futures.append(pool.submit(check_image_chunk, chunk, referenced, cache))
+                    chunk = []
+        if chunk:
+            futures.append(pool.submit(check_image_chunk, chunk, referenced, cache))
+        elsewhere_ok = list(pool.map(lambda pair: os.path.isfile(pair[1]) and image_decodes(pair[1]), elsewhere))
+        for future in futures:
+            for name, mtime_ns, size, ok, changed_ns in future.result():
+                found[name] = (changed_ns, ok)
+                if ok is not None:
+                    new_cache[name] = [mtime_ns, size, ok]
+
+    report['scanned'] = len(found)
+    for name, items in referenced.items():
+        reason = "missing" if name not in found else (None if found[name][1] else "unreadable")
+        if reason:
+            report['broken'].extend((item['id'], item['image_path'], reason) for item in items)
+    for (item, image_path), ok in zip(elsewhere, elsewhere_ok):
+        if not ok:
+            report['broken'].append((item['id'], item['image_path'], "missing" if not os.path.isfile(image_path) else "unreadable"))
+
+    # Record the verdict for every referenced image and re-count the items
+    # whose with_images changed (broken, restored or newly unreadable)
+    broken_ids = {item_id for item_id, _, _ in report['broken']}
+    recounted = []
+    for item in [item for items in referenced.values() for item in items] + [item for item, _ in elsewhere]:
+        image_scan_results[item['id']] = (item['image_path'], item['id'] not in broken_ids)
+        before = counted_as.get(item['id'])
+        uncount_item(item['id'])
+        count_item(item)
+        if counted_as[item['id']] != before:
+            recounted.append(("updated", item['id']))
+    emit_changes(recounted)
+
+    cutoff = (datetime.now().timestamp() - ORPHAN_GRACE_SECONDS) * 1e9
+    report['orphans'] = sorted(name for name, (changed_ns, _) in found.items()
+                               if name not in referenced and changed_ns < cutoff)
+
+    with open(IMAGE_SCAN_CACHE, "w") as f:
+        json.dump({'version': IMAGE_SCAN_CACHE_VERSION, 'decoder': image_decoder(), 'files': new_cache}, f)
+    return report
+
+# Free destination in the quarantine folder; never overwrite an earlier run's file
+def quarantine_path(name):
+    path = os.path.join(QUARANTINE_FOLDER, name)
+    base, ext = os.path.splitext(name)
+    counter = 1
+    while os.path.exists(path):
+        path = os.path.join(QUARANTINE_FOLDER, f"{base}_{counter}{ext}")
+        counter += 1
+    return path
+
+# Act on a scan report the user has confirmed: remove exactly the orphans it
+# lists (orphan_action "quarantine" or "delete") and optionally rewrite its
+# legacy image paths
+def clean_up_images(report, orphan_action=None, fix_legacy_paths=False):
+    if orphan_action:
+        # Skip files an item started using after the scan
+        in_use = {os.path.basename(resolve_image_path(item['image_path']))
+                  for item in data if item.get('image_path')}
+        if orphan_action == "quarantine" and report['orphans']:
+            os.makedirs(QUARANTINE_FOLDER, exist_ok=True)
+        for name in report['orphans']:
+            if name in in_use:
+                continue
+            try:
+                if orphan_action == "quarantine":
+                    os.replace(os.path.join(IMG_FOLDER, name), quarantine_path(name))
+                else:
+                    os.remove(os.path.join(IMG_FOLDER, name))
+                report['removed'] += 1
+            except OSError as e:
+                report['errors'].append(f"{name}: {e}")
+
+    if fix_legacy_paths:
+        sync_data_file()
+        fixed = []
+        for item_id, _, image_path in report['legacy']:
+            item = items_by_id.get(item_id)
+            if item is None:
+                continue  # deleted since the scan
+            unindex_item(item_id)
+            item['image_path'] = image_path
+            index_item(item)
+            fixed.append(("updated", item_id))
+        if fixed:
+            save_data(data)
+            emit_changes(fixed)
+    return report
+
+# One-line-per-finding summary of a scan report
+def format_scan_report(report, orphan_action=None):
+    lines = [f"Scanned {report['scanned']} files in {IMG_FOLDER}/"]
+    lines.append(f"{len(report['broken'])} broken image references")
+    lines += [f"  {path} ({reason})" for _, path, reason in report['broken'][:20]]
+    lines.append(f"{len(report['legacy'])} legacy backslash image paths")
+    lines.append(f"{len(report['orphans'])} unreferenced files")
+    if orphan_action:
+        verb = "quarantined" if orphan_action == "quarantine" else "deleted"
+        lines.append(f"{report['removed']} unreferenced files {verb}")
+    lines += [f"  error: {error}" for error in report['errors'][:20]]
+    return "\n".join(lines)
+
 # Add new item 
 def add_item():
     selected_image = None
@@ -140,11 +679,9 @@ def add_item():
             messagebox.showerror("Error", "Please select if this is a Lost or Found item.")
             return
             
-        data.append(item)
-        save_data(data)
+        insert_item(item)
         messagebox.showinfo("Success", "Item added successfully!")
         add_win.destroy()
-        refresh_main_view()
 
     add_win = tk.Toplevel(root)
     add_win.title("Add Lost/Found Item")
@@ -239,7 +776,8 @@ def view_item_details(item):
         desc_text.config(state=tk.DISABLED)
     
     # Image display
-    if item.get('image_path') and os.path.exists(item['image_path']):
+    image_path = resolve_image_path(item.get('image_path'))
+    if image_path and os.path.exists(image_path):
         img_frame = tk.Frame(detail_win)
         img_frame.pack(fill="both", expand=True, padx=10, pady=10)
         tk.Label(img_frame, text="Image:", font=("Arial", 10, "bold")).pack(anchor="w")
@@ -247,7 +785,7 @@ def view_item_details(item):
         try:
             # Load and resize image
             if PIL_AVAILABLE:
-                img = Image.open(item['image_path'])
+                img = Image.open(image_path)
                 img.thumbnail((400, 300), Image.Resampling.LANCZOS)
                 photo = ImageTk.PhotoImage(img)
                 
@@ -259,6 +797,102 @@ def view_item_details(item):
         except Exception as e:
             tk.Label(img_frame, text=f"Error loading image: {str(e)}", fg="red").pack()
 
+# How item cards are packed into the View Items list
+CARD_PACK = {"fill": "x", "padx": 10, "pady": 8, "ipady": 10}
+
+# Build one item card for the View Items list (the caller packs it)
+def build_item_card(parent, item):
+    # Create item card
+    card_frame = tk.Frame(parent, bg="#ffffff", relief=tk.RAISED, bd=2)
+    
+    # Left side - Image
+    left_frame = tk.Frame(card_frame, bg="#ffffff")
+    left_frame.pack(side=tk.LEFT, padx=15, pady=10)
+    
+    # Load and display image thumbnail
+    image_path = resolve_image_path(item.get('image_path'))
+    if image_path and os.path.exists(image_path):
+        try:
+            if PIL_AVAILABLE:
+                img = Image.open(image_path)
+                img.thumbnail((120, 120), Image.Resampling.LANCZOS)
+                photo = ImageTk.PhotoImage(img)
+                
+                img_label = tk.Label(left_frame, image=photo, bg="#ffffff", relief=tk.SUNKEN, bd=1)
+                img_label.image = photo  # Keep a reference
+                img_label.pack()
+            else:
+                info_label = tk.Label(left_frame, text="📷\nImage Available\n(PIL not installed)", 
+                                    bg="#f8f9fa", fg="#6c757d", width=15, height=8,
+                                    font=("Arial", 9), relief=tk.SUNKEN, bd=1, justify=tk.CENTER)
+                info_label.pack()
+        except Exception:
+            no_img_label = tk.Label(left_frame, text="📷\nImage Error", 
+                                  bg="#f8f9fa", fg="#6c757d", width=15, height=8,
+                                  font=("Arial", 9), relief=tk.SUNKEN, bd=1, justify=tk.CENTER)
+            no_img_label.pack()
+    else:
+        no_img_label = tk.Label(left_frame, text="📷\nNo Image\nAvailable", 
+                              bg="#f8f9fa", fg="#6c757d", width=15, height=8,
+                              font=("Arial", 9), relief=tk.SUNKEN, bd=1, justify=tk.CENTER)
+        no_img_label.pack()
+    
+    # Right side - Item details
+    right_frame = tk.Frame(card_frame, bg="#ffffff")
+    right_frame.pack(side=tk.LEFT, fill="both", expand=True, padx=15, pady=10)
+    
+    # Item name and type
+    name_frame = tk.Frame(right_frame, bg="#ffffff")
+    name_frame.pack(fill="x", anchor="w")
+    
+    name_label = tk.Label(name_frame, text=item['name'], font=("Arial", 14, "bold"), 
+                        bg="#ffffff", fg="#2c3e50")
+    name_label.pack(side=tk.LEFT)
+    
+    type_color = "#e74c3c" if item.get('type') == 'Lost' else "#27ae60"
+    type_label = tk.Label(name_frame, text=f"  [{item.get('type', 'N/A')}]", 
+                        font=("Arial", 10, "bold"), bg="#ffffff", fg=type_color)
+    type_label.pack(side=tk.LEFT)
+    
+    # Status
+    status_color = "#27ae60" if item['status'] == 'Open' else "#e74c3c"
+    status_icon = "🟢" if item['status'] == 'Open' else "🔴"
+    status_label = tk.Label(right_frame, text=f"{status_icon} Status: {item['status']}", 
+                          font=("Arial", 10, "bold"), bg="#ffffff", fg=status_color)
+    status_label.pack(anchor="w", pady=(5, 2))
+    
+    # Description (truncated)
+    desc_text = item.get('description', 'No description provided')
+    if len(desc_text) > 100:
+        desc_text = desc_text[:97] + "..."
+    desc_label = tk.Label(right_frame, text=f"Description: {desc_text}", 
+                        font=("Arial", 10), bg="#ffffff", fg="#34495e", wraplength=500, justify=tk.LEFT)
+    desc_label.pack(anchor="w", pady=2)
+    
+    # Posted by and contact
+    poster_label = tk.Label(right_frame, text=f"👤 Posted by: {item['poster']}", 
+                          font=("Arial", 10), bg="#ffffff", fg="#34495e")
+    poster_label.pack(anchor="w", pady=2)
+    
+    if item.get('contact'):
+        contact_label = tk.Label(right_frame, text=f"📞 Contact: {item['contact']}", 
+                               font=("Arial", 10), bg="#ffffff", fg="#34495e")
+        contact_label.pack(anchor="w", pady=2)
+    
+    # Created date
+    created = item.get('created_at', 'N/A')[:19] if item.get('created_at') else 'N/A'
+    date_label = tk.Label(right_frame, text=f"📅 Created: {created}", 
+                        font=("Arial", 9), bg="#ffffff", fg="#7f8c8d")
+    date_label.pack(anchor="w", pady=2)
+    
+    # View details button
+    detail_btn = tk.Button(right_frame, text="View Full Details", 
+                         command=lambda it=item: view_item_details(it),
+                         bg="#3498db", fg="white", font=("Arial", 9, "bold"),
+                         relief=tk.RAISED, bd=2)
+    detail_btn.pack(anchor="e", pady=(10, 0))
+    return card_frame
+
 # View all items with filtering and search
 def view_items():
     view_win = tk.Toplevel(root)
@@ -279,6 +913,11 @@ def view_items():
     type_combo = ttk.Combobox(filter_frame, textvariable=type_var, values=["All", "Lost", "Found"], state="readonly", width=10)
     type_combo.pack(side=tk.LEFT, padx=5, pady=5)
     
+    tk.Label(filter_frame, text="Sort by:", font=("Arial", 10, "bold"), bg="#ecf0f1").pack(side=tk.LEFT, padx=(20, 5), pady=5)
+    sort_var = tk.StringVar(value="Newest")
+    sort_combo = ttk.Combobox(filter_frame, textvariable=sort_var, values=list(SORT_OPTIONS), state="readonly", width=16)
+    sort_combo.pack(side=tk.LEFT, padx=5, pady=5)
+    
     # Search frame
     search_frame = tk.Frame(view_win, bg="#ecf0f1", relief=tk.RAISED, bd=2)
     search_frame.pack(fill="x", padx=10, pady=5)
@@ -288,6 +927,16 @@ def view_items():
     search_entry = tk.Entry(search_frame, textvariable=search_var, width=30, font=("Arial", 10))
     search_entry.pack(side=tk.LEFT, padx=5, pady=5)
     
+    # Date range filters (YYYY-MM-DD, both ends inclusive)
+    date_vars = {}
+    for key, label in (("created_from", "Created from:"), ("created_to", "to"),
+                       ("updated_from", "Updated from:"), ("updated_to", "to")):
+        tk.Label(search_frame, text=label, font=("Arial", 10, "bold"), bg="#ecf0f1").pack(side=tk.LEFT, padx=(10, 2), pady=5)
+        date_vars[key] = tk.StringVar()
+        date_entry = tk.Entry(search_frame, textvariable=date_vars[key], width=11, font=("Arial", 10))
+        date_entry.pack(side=tk.LEFT, padx=2, pady=5)
+        date_entry.bind("<Return>", lambda e: show_first_page())
+    
     # Main content frame with scrollable canvas
     main_frame = tk.Frame(view_win)
     main_frame.pack(fill="both", expand=True, padx=10, pady=5)
@@ -308,128 +957,125 @@ def view_items():
     canvas.pack(side="left", fill="both", expand=True)
     scrollbar.pack(side="right", fill="y")
     
-    def update_items_display():
+    # Cursor of every page visited so far (None = first page) and of the next one
+    page_cursors = [None]
+    next_cursor = [None]
+    # Filters of the page on screen, and its cards in display order
+    current_query = {}
+    cards = {}
+    shown_ids = []
+    empty_label = []
+    
+    def fetch_page():
+        result = query_items(cursor=page_cursors[-1], **current_query)
+        next_cursor[0] = result['next_cursor']
+        
+        page_text = f"Page {len(page_cursors)}"
+        if result['total'] is not None:
+            page_text += f" of {max(1, -(-result['total'] // PAGE_SIZE))} ({result['total']} items)"
+        page_label.config(text=page_text)
+        prev_btn.config(state=tk.NORMAL if len(page_cursors) > 1 else tk.DISABLED)
+        next_btn.config(state=tk.NORMAL if next_cursor[0] is not None else tk.DISABLED)
+        return result['items']
+    
+    def show_empty_message(empty):
+        if empty and not empty_label:
+            no_items_label = tk.Label(scrollable_frame, text="No items found matching your criteria", 
+                                    font=("Arial", 16), bg="white", fg="#7f8c8d")
+            no_items_label.pack(expand=True, pady=50)
+            empty_label.append(no_items_label)
+        elif not empty and empty_label:
+            empty_label.pop().destroy()
+    
+    # Filters as entered, or None (after telling the user) if a date is invalid
+    def read_query():
+        try:
+            date_filters = {key: parse_date_filter(var.get()) for key, var in date_vars.items()}
+        except ValueError:
+            messagebox.showerror("Error", "Dates must be in YYYY-MM-DD format.", parent=view_win)
+            return None
+        return dict(status=status_var.get(), item_type=type_var.get(),
+                    search=search_var.get(), sort=sort_var.get(), **date_filters)
+    
+    # Redraw the page; without a query the filters are read from the window
+    # (cursors from other filters are dropped), otherwise it is used as is
+    def update_items_display(query=None):
+        if query is None:
+            query = read_query()
+            if query is None:
+                return
+            if query != current_query:
+                del page_cursors[1:]
+        current_query.clear()
+        current_query.update(query)
+        
         # Clear existing items
         for widget in scrollable_frame.winfo_children():
             widget.destroy()
+        cards.clear()
+        empty_label.clear()
         
-        # Filter data
-        filtered_data = data[:]
-        
-        if status_var.get() != "All":
-            filtered_data = [item for item in filtered_data if item['status'] == status_var.get()]
-        
-        if type_var.get() != "All":
-            filtered_data = [item for item in filtered_data if item.get('type') == type_var.get()]
-        
-        search_text = search_var.get().lower()
-        if search_text:
-            filtered_data = [item for item in filtered_data if 
-                           search_text in item['name'].lower() or 
-                           search_text in item.get('description', '').lower() or
-                           search_text in item['poster'].lower()]
+        filtered_data = fetch_page()
+        canvas.yview_moveto(0)
         
         # Display items in cards with images
-        for i, item in enumerate(filtered_data):
-            # Create item card
-            card_frame = tk.Frame(scrollable_frame, bg="#ffffff", relief=tk.RAISED, bd=2)
-            card_frame.pack(fill="x", padx=10, pady=8, ipady=10)
-            
-            # Left side - Image
-            left_frame = tk.Frame(card_frame, bg="#ffffff")
-            left_frame.pack(side=tk.LEFT, padx=15, pady=10)
-            
-            # Load and display image thumbnail
-            if item.get('image_path') and os.path.exists(item['image_path']):
-                try:
-                    if PIL_AVAILABLE:
-                        img = Image.open(item['image_path'])
-                        img.thumbnail((120, 120), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                        
-                        img_label = tk.Label(left_frame, image=photo, bg="#ffffff", relief=tk.SUNKEN, bd=1)
-                        img_label.image = photo  # Keep a reference
-                        img_label.pack()
-                    else:
-                        info_label = tk.Label(left_frame, text="📷\nImage Available\n(PIL not installed)", 
-                                            bg="#f8f9fa", fg="#6c757d", width=15, height=8,
-                                            font=("Arial", 9), relief=tk.SUNKEN, bd=1, justify=tk.CENTER)
-                        info_label.pack()
-                except Exception:
-                    no_img_label = tk.Label(left_frame, text="📷\nImage Error", 
-                                          bg="#f8f9fa", fg="#6c757d", width=15, height=8,
-                                          font=("Arial", 9), relief=tk.SUNKEN, bd=1, justify=tk.CENTER)
-                    no_img_label.pack()
-            else:
-                no_img_label = tk.Label(left_frame, text="📷\nNo Image\nAvailable", 
-                                      bg="#f8f9fa", fg="#6c757d", width=15, height=8,
-                                      font=("Arial", 9), relief=tk.SUNKEN, bd=1, justify=tk.CENTER)
-                no_img_label.pack()
-            
-            # Right side - Item details
-            right_frame = tk.Frame(card_frame, bg="#ffffff")
-            right_frame.pack(side=tk.LEFT, fill="both", expand=True, padx=15, pady=10)
-            
-            # Item name and type
-            name_frame = tk.Frame(right_frame, bg="#ffffff")
-            name_frame.pack(fill="x", anchor="w")
-            
-            name_label = tk.Label(name_frame, text=item['name'], font=("Arial", 14, "bold"), 
-                                bg="#ffffff", fg="#2c3e50")
-            name_label.pack(side=tk.LEFT)
-            
-            type_color = "#e74c3c" if item.get('type') == 'Lost' else "#27ae60"
-            type_label = tk.Label(name_frame, text=f"  [{item.get('type', 'N/A')}]", 
-                                font=("Arial", 10, "bold"), bg="#ffffff", fg=type_color)
-            type_label.pack(side=tk.LEFT)
-            
-            # Status
-            status_color = "#27ae60" if item['status'] == 'Open' else "#e74c3c"
-            status_icon = "🟢" if item['status'] == 'Open' else "🔴"
-            status_label = tk.Label(right_frame, text=f"{status_icon} Status: {item['status']}", 
-                                  font=("Arial", 10, "bold"), bg="#ffffff", fg=status_color)
-            status_label.pack(anchor="w", pady=(5, 2))
-            
-            # Description (truncated)
-            desc_text = item.get('description', 'No description provided')
-            if len(desc_text) > 100:
-                desc_text = desc_text[:97] + "..."
-            desc_label = tk.Label(right_frame, text=f"Description: {desc_text}", 
-                                font=("Arial", 10), bg="#ffffff", fg="#34495e", wraplength=500, justify=tk.LEFT)
-            desc_label.pack(anchor="w", pady=2)
-            
-            # Posted by and contact
-            poster_label = tk.Label(right_frame, text=f"👤 Posted by: {item['poster']}", 
-                                  font=("Arial", 10), bg="#ffffff", fg="#34495e")
-            poster_label.pack(anchor="w", pady=2)
-            
-            if item.get('contact'):
-                contact_label = tk.Label(right_frame, text=f"📞 Contact: {item['contact']}", 
-                                       font=("Arial", 10), bg="#ffffff", fg="#34495e")
-                contact_label.pack(anchor="w", pady=2)
-            
-            # Created date
-            created = item.get('created_at', 'N/A')[:19] if item.get('created_at') else 'N/A'
-            date_label = tk.Label(right_frame, text=f"📅 Created: {created}", 
-                                font=("Arial", 9), bg="#ffffff", fg="#7f8c8d")
-            date_label.pack(anchor="w", pady=2)
-            
-            # View details button
-            detail_btn = tk.Button(right_frame, text="View Full Details", 
-                                 command=lambda it=item: view_item_details(it),
-                                 bg="#3498db", fg="white", font=("Arial", 9, "bold"),
-                                 relief=tk.RAISED, bd=2)
-            detail_btn.pack(anchor="e", pady=(10, 0))
+        for item in filtered_data:
+            cards[item['id']] = build_item_card(scrollable_frame, item)
+            cards[item['id']].pack(**CARD_PACK)
+        shown_ids[:] = [item['id'] for item in filtered_data]
+        show_empty_message(not filtered_data)
+    
+    # Patch the page on screen after a change: only cards for items that
+    # entered, left or changed on this page are built or destroyed
+    def on_item_change(changes):
+        updated = {item_id for kind, item_id in changes if kind == "updated"}
+        page_ids = [item['id'] for item in fetch_page()]
+        for old_id in shown_ids:
+            if old_id not in page_ids or old_id in updated:
+                old_card = cards.pop(old_id)
+                if old_id in page_ids:
+                    cards[old_id] = build_item_card(scrollable_frame, items_by_id[old_id])
+                    cards[old_id].pack(after=old_card, **CARD_PACK)
+                old_card.destroy()
+        for new_id in page_ids:
+            if new_id not in cards:
+                cards[new_id] = build_item_card(scrollable_frame, items_by_id[new_id])
         
-        if not filtered_data:
-            no_items_label = tk.Label(scrollable_frame, text="No items found matching your criteria", 
-                                    font=("Arial", 16), bg="white", fg="#7f8c8d")
-            no_items_label.pack(expand=True, pady=50)
+        # Re-pack (without rebuilding) only if the order on the page changed
+        if page_ids != shown_ids:
+            for page_id in page_ids:
+                cards[page_id].pack_forget()
+            for page_id in page_ids:
+                cards[page_id].pack(**CARD_PACK)
+        shown_ids[:] = page_ids
+        show_empty_message(not page_ids)
+    
+    subscribe_changes(on_item_change)
+    view_win.bind("<Destroy>", lambda e: unsubscribe_changes(on_item_change) if e.widget is view_win else None)
+    
+    def show_first_page():
+        query = read_query()
+        if query is None:
+            return
+        del page_cursors[1:]
+        update_items_display(query)
+    
+    # Paging keeps the filters the current page was fetched with
+    def show_next_page():
+        if next_cursor[0] is not None:
+            page_cursors.append(next_cursor[0])
+            update_items_display(dict(current_query))
+    
+    def show_prev_page():
+        if len(page_cursors) > 1:
+            page_cursors.pop()
+            update_items_display(dict(current_query))
     
     # Bind events
-    status_combo.bind("<<ComboboxSelected>>", lambda e: update_items_display())
-    type_combo.bind("<<ComboboxSelected>>", lambda e: update_items_display())
-    search_entry.bind("<KeyRelease>", lambda e: update_items_display())
+    status_combo.bind("<<ComboboxSelected>>", lambda e: show_first_page())
+    type_combo.bind("<<ComboboxSelected>>", lambda e: show_first_page())
+    sort_combo.bind("<<ComboboxSelected>>", lambda e: show_first_page())
+    search_entry.bind("<KeyRelease>", lambda e: show_first_page())
     
     # Buttons frame
     button_frame = tk.Frame(view_win, bg="#ecf0f1", relief=tk.RAISED, bd=2)
@@ -437,6 +1083,14 @@ def view_items():
     
     tk.Button(button_frame, text="🔄 Refresh", command=update_items_display, 
               bg="#9b59b6", fg="white", font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=5, pady=5)
+    prev_btn = tk.Button(button_frame, text="◀ Prev", command=show_prev_page,
+                         bg="#3498db", fg="white", font=("Arial", 10, "bold"))
+    prev_btn.pack(side=tk.LEFT, padx=(20, 5), pady=5)
+    page_label = tk.Label(button_frame, text="Page 1", font=("Arial", 10, "bold"), bg="#ecf0f1")
+    page_label.pack(side=tk.LEFT, padx=5, pady=5)
+    next_btn = tk.Button(button_frame, text="Next ▶", command=show_next_page,
+                         bg="#3498db", fg="white", font=("Arial", 10, "bold"))
+    next_btn.pack(side=tk.LEFT, padx=5, pady=5)
     tk.Button(button_frame, text="❌ Close", command=view_win.destroy,
               bg="#95a5a6", fg="white", font=("Arial", 10, "bold")).pack(side=tk.RIGHT, padx=5, pady=5)
     
@@ -465,12 +1119,11 @@ def update_status():
                         messagebox.showinfo("Info", f"{name} is already marked as Claimed.")
                         return
                     
-                    item["status"] = "Claimed"
-                    item["updated_at"] = datetime.now().isoformat()
-                    save_data(data)
+                    if modify_item(item["id"], status="Claimed", updated_at=datetime.now().isoformat()) is None:
+                        messagebox.showerror("Error", "Item not found. It may have been deleted elsewhere.")
+                        return
                     messagebox.showinfo("Success", f"{name} marked as Claimed successfully!")
                     update_win.destroy()
-                    refresh_main_view()
                     return
                 else:
                     messagebox.showerror("Error", "Incorrect verification password.")
@@ -492,12 +1145,11 @@ def update_status():
                         messagebox.showinfo("Info", f"{name} is already marked as Open.")
                         return
                     
-                    item["status"] = "Open"
-                    item["updated_at"] = datetime.now().isoformat()
-                    save_data(data)
+                    if modify_item(item["id"], status="Open", updated_at=datetime.now().isoformat()) is None:
+                        messagebox.showerror("Error", "Item not found. It may have been deleted elsewhere.")
+                        return
                     messagebox.showinfo("Success", f"{name} reopened successfully!")
                     update_win.destroy()
-                    refresh_main_view()
                     return
                 else:
                     messagebox.showerror("Error", "Incorrect verification password.")
@@ -557,24 +1209,25 @@ def delete_item():
             messagebox.showerror("Error", "Both Item Name and Password are required.")
             return
         
-        for i, item in enumerate(data):
+        for item in data:
             if item["name"].lower() == name.lower():
                 if item["password"] == password:
                     confirm = messagebox.askyesno("Confirm Delete", 
                                                 f"Are you sure you want to delete '{name}'?\nThis action cannot be undone.")
                     if confirm:
                         # Delete associated image if exists
-                        if item.get('image_path') and os.path.exists(item['image_path']):
+                        image_path = resolve_image_path(item.get('image_path'))
+                        if image_path and os.path.exists(image_path):
                             try:
-                                os.remove(item['image_path'])
-                            except:
-                                pass  # Image deletion failed but continue with item deletion
+                                os.remove(image_path)
+                            except OSError:
+                                pass  # Left for the image check to clean up; continue with item deletion
                         
-                        data.pop(i)
-                        save_data(data)
+                        if remove_item(item["id"]) is None:
+                            messagebox.showerror("Error", "Item not found. It may have been deleted elsewhere.")
+                            return
                         messagebox.showinfo("Success", f"Item '{name}' deleted successfully!")
                         delete_win.destroy()
-                        refresh_main_view()
                     return
                 else:
                     messagebox.showerror("Error", "Incorrect verification password.")
@@ -621,21 +1274,33 @@ def delete_item():
 
 # Dashboard status
 def get_statistics():
-    total_items = len(data)
-    open_items = len([item for item in data if item['status'] == 'Open'])
-    claimed_items = len([item for item in data if item['status'] == 'Claimed'])
-    lost_items = len([item for item in data if item.get('type') == 'Lost'])
-    found_items = len([item for item in data if item.get('type') == 'Found'])
-    items_with_images = len([item for item in data if item.get('image_path') and os.path.exists(item.get('image_path', ''))])
+    return dict(item_counts)
+
+# Image maintenance: report broken image references, then offer to clean up
+def check_images():
+    root.config(cursor="watch")
+    root.update_idletasks()
+    try:
+        report = scan_images()
+    finally:
+        root.config(cursor="")
+    messagebox.showinfo("Image Check", format_scan_report(report))
     
-    return {
-        'total': total_items,
-        'open': open_items,
-        'claimed': claimed_items,
-        'lost': lost_items,
-        'found': found_items,
-        'with_images': items_with_images
-    }
+    orphan_action = None
+    if report['orphans']:
+        choice = messagebox.askyesnocancel("Unreferenced Images",
+                                           f"{len(report['orphans'])} image files are not used by any item.\n"
+                                           f"Yes = Move to {QUARANTINE_FOLDER}\nNo = Delete permanently\nCancel = Keep them")
+        if choice is True:
+            orphan_action = "quarantine"
+        elif choice is False:
+            orphan_action = "delete"
+    fix_paths = bool(report['legacy']) and messagebox.askyesno("Legacy Image Paths",
+                                                               f"{len(report['legacy'])} items use Windows-style image paths.\nRewrite them?")
+    
+    if orphan_action or fix_paths:
+        clean_up_images(report, orphan_action, fix_paths)
+        messagebox.showinfo("Image Check", format_scan_report(report, orphan_action))
 
 # Refresh main view
 def refresh_main_view():
@@ -647,7 +1312,7 @@ def setup_main_window():
     global stats_label
     
     root.title("🔍 Lost & Found Management System")
-    root.geometry("600x500")
+    root.geometry("600x580")
     root.configure(bg="#f0f0f0")
     
     # Title
@@ -690,6 +1355,11 @@ def setup_main_window():
                     width=25, height=2, relief=tk.RAISED, bd=3)
     btn5.pack(pady=8)
     
+    btn7 = tk.Button(button_frame, text="🧹 Check Images", command=check_images,
+                    font=("Arial", 14, "bold"), bg="#16a085", fg="white",
+                    width=25, height=2, relief=tk.RAISED, bd=3)
+    btn7.pack(pady=8)
+    
     btn6 = tk.Button(button_frame, text="❌ Exit", command=root.quit,
                     font=("Arial", 14, "bold"), bg="#95a5a6", fg="white",
                     width=25, height=2, relief=tk.RAISED, bd=3)
@@ -701,14 +1371,43 @@ def setup_main_window():
                            font=("Arial", 10), bg="#f0f0f0", fg="#7f8c8d", wraplength=500)
     instructions.pack(pady=10)
     
-    # Initial stats load
+    # Initial stats load, then keep it current from the change feed
     refresh_main_view()
+    subscribe_changes(lambda changes: refresh_main_view())
 
-# Main app window
-root = tk.Tk()
-data = load_data()
-ensure_img_folder()
-
-setup_main_window()
+# Command-line options; without --check-images the app starts as usual
+def parse_args():
+    parser = argparse.ArgumentParser(description="Lost & Found Management System")
+    parser.add_argument("--check-images", action="store_true",
+                        help=f"scan {IMG_FOLDER}/ for broken and unreferenced images, then exit")
+    orphans = parser.add_mutually_exclusive_group()
+    orphans.add_argument("--quarantine", action="store_true",
+                         help=f"move unreferenced images to {QUARANTINE_FOLDER}")
+    orphans.add_argument("--delete-orphans", action="store_true",
+                         help="delete unreferenced images permanently")
+    parser.add_argument("--fix-paths", action="store_true",
+                        help="rewrite legacy backslash image paths")
+    args = parser.parse_args()
+    if (args.quarantine or args.delete_orphans or args.fix_paths) and not args.check_images:
+        parser.error("--quarantine, --delete-orphans and --fix-paths require --check-images")
+    return args
 
-root.mainloop()
\ No newline at end of file
+# Main app window
+if __name__ == "__main__":
+    args = parse_args()
+    if args.check_images:
+        # Headless image maintenance
+        open_data()
+        action = "quarantine" if args.quarantine else "delete" if args.delete_orphans else None
+        report = clean_up_images(scan_images(), action, args.fix_paths)
+        print(format_scan_report(report, action))
+        raise SystemExit(0)
+    
+    root = tk.Tk()
+    open_data()
+    ensure_img_folder()
+    
+    setup_main_window()
+    root.after(WATCH_INTERVAL_MS, watch_data_file)
+    
+    root.mainloop()